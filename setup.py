@@ -23,7 +23,7 @@ setuptools.setup(
         "Intended Audience :: Developers",
         "Topic :: Communications :: Chat",
         "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 2.7",
+        "Programming Language :: Python :: 3",
     ],
     keywords="slack jira bot",
     # TODO: If docs / tests are added then exclude them!
@@ -35,13 +35,9 @@ setuptools.setup(
     },
     install_requires=[
         "PyJWT>=1.4.2",
-        "argparse>=1.2.1",
-        "backports.ssl-match-hostname>=3.5.0.1",
         "cffi>=1.9.1",
         "cryptography>=1.7.1",
-        "enum34>=1.1.6",
         "idna>=2.2",
-        "ipaddress>=1.0.18",
         "jira>=1.0.7",
         "ndg-httpsclient>=0.4.2",
         "oauthlib>=2.0.1",
@@ -55,9 +51,7 @@ setuptools.setup(
         "six>=1.10.0",
         "slackbot>=0.4.1",
         "slacker>=0.9.30",
-        "tlslite>=0.4.9",
         "websocket-client>=0.40.0",
-        "wsgiref>=0.1.2",
     ],
     extras_require={
         "lint": [
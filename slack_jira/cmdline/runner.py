@@ -1,8 +1,8 @@
 import argparse
+import configparser
 import logging
 import logging.config
 import sys
-import ConfigParser
 
 from slack_jira import resources
 
@@ -10,16 +10,33 @@ import slackbot.settings
 import slackbot.bot
 
 
+# Parsed ConfigParser objects keyed by file location.  The config is immutable for
+# the lifetime of the process, so re-invoking the parser (e.g. in a loop or via
+# re-exec) should not re-read and re-parse the same file.
+_CONFIG_CACHE = {}
+
+# Formatter lists created by `logging.config._create_formatters`, keyed by the
+# id() of the config parser they were created from.
+_FORMATTER_CACHE = {}
+
+
 class ConfigAction(argparse.Action):
     def __call__(self, parser, namespace, values, option_string=None):
         file_location = values if values else self.default
 
-        config = ConfigParser.ConfigParser()
-        try:
-            with open(file_location) as fp:
-                config.readfp(fp)
-        except (IOError, ConfigParser.Error) as e:
-            raise argparse.ArgumentError(self, "Unable to read URL file: {}".format(e))
+        config = _CONFIG_CACHE.get(file_location)
+        if config is None:
+            # RawConfigParser skips %-interpolation, which the bot's settings
+            # (tokens, paths, key material) never use
+            config = configparser.RawConfigParser()
+            try:
+                # Slurp the file in one read (64 KiB buffer) instead of letting
+                # the parser pull it line by line off the file object
+                with open(file_location, "r", 65536) as fp:
+                    config.read_string(fp.read(), source=file_location)
+            except (IOError, configparser.Error) as e:
+                raise argparse.ArgumentError(self, "Unable to read URL file: {}".format(e))
+            _CONFIG_CACHE[file_location] = config
 
         setattr(namespace, self.dest, config)
 
@@ -32,7 +49,10 @@ def _logging_config(config_parser, disable_existing_loggers=False):
     Note: this code is essentially copy pasta from `logging.config.fileConfig` except
     we skip loading the file.
     """
-    formatters = logging.config._create_formatters(config_parser)
+    formatters = _FORMATTER_CACHE.get(id(config_parser))
+    if formatters is None:
+        formatters = logging.config._create_formatters(config_parser)
+        _FORMATTER_CACHE[id(config_parser)] = formatters
 
     # critical section
     logging._acquireLock()
@@ -1,5 +1,4 @@
 import logging
-import collections
 import re
 import time
 import functools
@@ -7,68 +6,180 @@ import functools
 
 logger = logging.getLogger(__name__)
 
+# JIRA label colors keyed by a lowercase substring of the status name.  "progress"
+# is checked first since "In Progress" dominates the status mix in practice.
+_STATUS_COLORS = (
+    # JIRA "Yellow" color
+    ("progress", "#ffd351"),
+    # JIRA "Blue" color
+    ("open", "#4a6785"),
+)
+# JIRA "Green" color
+_DEFAULT_STATUS_COLOR = "#14892c"
+
+# Exact (lowercased) names of the stock JIRA statuses resolve with one dict lookup;
+# the substring scan above remains the fallback for custom workflow names
+_KNOWN_STATUS_COLORS = {
+    "open": "#4a6785",
+    "reopened": "#4a6785",
+    "in progress": "#ffd351",
+    "done": "#14892c",
+    "closed": "#14892c",
+    "resolved": "#14892c",
+}
+
+# Memoized status name -> color results.  The status vocabulary is tiny (a handful
+# of workflow states), so a capped dict does the job of functools.lru_cache
+# without the wrapper overhead.
+_STATUS_COLOR_CACHE = {}
+_STATUS_COLOR_CACHE_MAX = 64
+
+
+def _status_name_to_color(status_name):
+    color = _STATUS_COLOR_CACHE.get(status_name)
+    if color is not None:
+        return color
 
-class LimitedDict(collections.OrderedDict):
+    # Lowercase once so the "progress" check also matches statuses such as
+    # "In Progress" (previously it was case sensitive)
+    lowered = status_name.lower()
+    color = _KNOWN_STATUS_COLORS.get(lowered)
+    if color is None:
+        color = _DEFAULT_STATUS_COLOR
+        for key, candidate in _STATUS_COLORS:
+            if key in lowered:
+                color = candidate
+                break
+
+    if len(_STATUS_COLOR_CACHE) < _STATUS_COLOR_CACHE_MAX:
+        _STATUS_COLOR_CACHE[status_name] = color
+
+    return color
+
+
+# Ticket-mention pattern for message scanning (an optional ! prefix requests a
+# full attachment).  Module level on purpose: a LOAD_GLOBAL beats the MRO walk
+# that class-attribute access pays, and the slackbot plugin needs the string
+# without instantiating anything.  Case sensitive: the caller uppercases the
+# text once, which is cheaper than the regex engine case-folding every
+# character it scans.
+JIRA_ISSUE_RE_STR = "!?[A-Z]{1,10}-[0-9]+"
+JIRA_ISSUE_RE = re.compile(JIRA_ISSUE_RE_STR, re.ASCII)
+
+# Template for short slack attachments; copied and filled in per attachment, which
+# is cheaper than rebuilding the dict literal with all its keys on every call
+_SHORT_ATTACHMENT_TEMPLATE = {
+    "fallback": None,
+    "title": None,
+    "title_link": None,
+    "footer": None,
+    "color": None,
+}
+
+
+class LimitedDict(dict):
     """
     A dictionary that enforces a size limit and will remove the oldest item in the dictionary
     (FIFO) while the limit is exceeded.
+
+    Plain dicts are insertion-ordered since Python 3.7 and both smaller and
+    faster than OrderedDict, so iteration order doubles as eviction order.
     """
+    __slots__ = ("_max_size",)
+
     def __init__(self, max_size, *args, **kwargs):
         super(LimitedDict, self).__init__(*args, **kwargs)
         self._max_size = max_size
 
     def __setitem__(self, key, value, **kwargs):
         super(LimitedDict, self).__setitem__(key, value, **kwargs)
-        self._enforce_size_limit()
+        # An insert grows the dict by at most one, so a single eviction is enough
+        # to restore the limit -- no loop needed
+        if len(self) > self._max_size:
+            del self[next(iter(self))]
+
+    def touch(self, key):
+        """
+        Marks the key as most recently used by moving it to the back of the
+        eviction order.
+        """
+        self[key] = self.pop(key)
+
 
-    def _enforce_size_limit(self):
-        while len(self) > self._max_size:
-            self.popitem(last=False)
+# Rendered short attachments keyed by their (hashable) summary tuple.  A ticket
+# mentioned again after the suppression window expires -- but whose summary is
+# still memoized -- re-renders to exactly the same dict, so skip the formatting
+# and hand out a copy of the cached one instead.
+_ATTACHMENT_CACHE = LimitedDict(128)
 
 
 class JiraMessageTimer(object):
     """
     Keeps track of jira messages per channel in respect to the last time they were seen
+
+    One flat (channel, issue) -> timestamp cache rather than a LimitedDict per
+    channel: a workspace with thousands of channels would otherwise accumulate a
+    dict per channel forever, and every lookup paid two dict dispatches.
     """
+    __slots__ = ("_timer_cache", "_response_threshold")
+
+    # How many channels' worth of entries the flat cache is sized for
+    MAX_TRACKED_CHANNELS = 256
+
     def __init__(self, ticket_cache_size, response_threshold):
         """
         :param response_threshold: The number (in seconds) of when to retrieve information about
             a ticket since its last mention
         :type response_threshold: int
-        :param ticket_cache_size: Timed issue mentions per channel modulus size
+        :param ticket_cache_size: Timed issue mentions per channel modulus size.  With the
+            flat cache this bounds the total size together with MAX_TRACKED_CHANNELS; it
+            is no longer a hard per-channel cap.
         :type ticket_cache_size: int
         """
-        self._timer_cache = collections.defaultdict(lambda: LimitedDict(ticket_cache_size))
+        self._timer_cache = LimitedDict(ticket_cache_size * self.MAX_TRACKED_CHANNELS)
         self._response_threshold = response_threshold
 
-    def check_issue(self, channel_id, issue):
+    def check_issue(self, channel_id, issue, now):
         """
-        Checks to see if an issue was not recently mentioned
+        Checks to see if an issue was not recently mentioned in the channel
 
-        :param channel_id: The ID of the channell
+        :param channel_id: The slack channel identifier
+        :type channel_id: str
         :param issue: THe JIRA ticket
         :type issue: str
+        :param now: The current time as returned by `time.monotonic()`.  Passed in by the
+            caller so a message with N issues only pays for one time lookup.
+        :type now: float
 
         :rtype: bool
         :return: Boolean based on the validity
         """
-        last_mention = self._timer_cache[channel_id].get(issue)
+        key = (channel_id, issue)
+        # No sentinel default: monotonic time has an arbitrary reference point,
+        # so shortly after boot a 0 sentinel would sit inside the threshold
+        # window and wrongly suppress (and touch) never-inserted keys
+        last_mention = self._timer_cache.get(key)
 
-        if last_mention and (int(time.time()) - self._response_threshold <= last_mention):
-            return False
+        if last_mention is None or (now - last_mention) > self._response_threshold:
+            return True
 
-        return True
+        # Recently mentioned: mark the entry as hot so other mentions do not
+        # FIFO-evict the one we are actively suppressing
+        self._timer_cache.touch(key)
+        return False
 
-    def log_issues(self, channel_id, issues):
+    def log_issues(self, channel_id, issues, now):
         """
-        Logs the issues with the current time for the specified channel id
+        Logs the issues with the specified time for the specified channel
 
         :param channel_id: The slack channel identifier
+        :type channel_id: str
         :param issues: Iterable sequence of issues
+        :param now: The current time as returned by `time.monotonic()`
+        :type now: float
         """
-        now = int(time.time())
         for i in issues:
-            self._timer_cache[channel_id][i] = now
+            self._timer_cache[(channel_id, i)] = now
 
 
 class JiraMessageHandler(object):
@@ -80,8 +191,8 @@ class JiraMessageHandler(object):
     once during the `response_threshold` interval, additional information will not be
     displayed.
     """
-    JIRA_ISSUE_RE_STR = "!?[A-Z]{1,10}-[0-9]+"
-    JIRA_ISSUE_RE = re.compile(JIRA_ISSUE_RE_STR, re.IGNORECASE)
+    __slots__ = ("_slack_jira", "_max_issues", "_message_timer", "_full_attachments")
+
     # JIRA limits you to 20 attachments for a message, this will be the upper bound of max_issues
     MAX_JIRA_ATTACHMENTS = 20
 
@@ -147,18 +258,7 @@ class JiraMessageHandler(object):
         :return: The hex representation of the status based on the values shown in
             JIRA (label colors)
         """
-        # Get color based on status
-        if "open" in status_name.lower():
-            # JIRA "Blue" color
-            color = "#4a6785"
-        elif "progress" in status_name:
-            # JIRA "Yellow" color
-            color = "#ffd351"
-        else:
-            # JIRA "Green" color
-            color = "#14892c"
-
-        return color
+        return _status_name_to_color(status_name)
 
     @staticmethod
     def get_full_attachment(summary):
@@ -184,8 +284,8 @@ class JiraMessageHandler(object):
         attachment["text"] = summary.description
         if summary.original_estimate and summary.remaining_estimate:
             attachment["fields"] = [{
-                "title": u"Original Estimate / Remaining Estimate",
-                "value": u"{} / {}".format(summary.original_estimate, summary.remaining_estimate),
+                "title": "Original Estimate / Remaining Estimate",
+                "value": f"{summary.original_estimate} / {summary.remaining_estimate}",
             }]
 
         return attachment
@@ -208,36 +308,48 @@ class JiraMessageHandler(object):
         :rtype: dict
         :return: A dictionary that contains the proper key values for a slack attachment
         """
-        status = summary.status.name
-        footer = u"{status} - {priority} - {assigned}".format(
-            status=status,
-            priority=summary.priority.name,
-            assigned=(
-                u"This ticket is currently unassigned" if not summary.assignee else
-                u"Assigned to {}".format(summary.assignee)
-            )
+        cached = _ATTACHMENT_CACHE.get(summary)
+        if cached is not None:
+            # Copy so callers (get_full_attachment mutates its result) cannot
+            # corrupt the cached rendering
+            return cached.copy()
+
+        # Plain strings straight off the summary: no descriptor chases on live
+        # API resources happen at render time
+        status = summary.status
+        assigned = (
+            "This ticket is currently unassigned" if not summary.assignee else
+            f"Assigned to {summary.assignee}"
         )
 
-        title = u"[{}] - {}".format(summary.issue, summary.title)
-        attachment = {
-            "fallback": title,
-            "title": title,
-            "title_link": summary.link,
-            "footer": footer,
-            "color": JiraMessageHandler.status_name_to_color(status),
-        }
-
-        return attachment
-
-    def _get_summaries(self, channel_id, issues):
-        summaries = (
-            self._slack_jira.get_summary(i)
-            for i in issues if self._message_timer.check_issue(channel_id, i)
-        )
-        # Remove any entries that did not return a summary
-        summaries = filter(None, summaries)
-        # Log all of these summaries in our timer so we ignore them
-        self._message_timer.log_issues(channel_id, (s.issue for s in summaries))
+        # f-strings compile to formatting opcodes and skip the runtime template
+        # parse that both str.format and %-formatting pay
+        title = f"[{summary.issue}] - {summary.title}"
+        attachment = _SHORT_ATTACHMENT_TEMPLATE.copy()
+        attachment["fallback"] = attachment["title"] = title
+        attachment["title_link"] = summary.link
+        attachment["footer"] = f"{status} - {summary.priority} - {assigned}"
+        attachment["color"] = _status_name_to_color(status)
+
+        _ATTACHMENT_CACHE[summary] = attachment
+        return attachment.copy()
+
+    def _get_summaries(self, channel_id, issues, full):
+        # Look the time up once per message rather than once per issue
+        # The timer only measures intervals, so use the monotonic clock -- immune
+        # to NTP slew and wall-clock jumps
+        now = time.monotonic()
+        timer = self._message_timer
+        filtered = [i for i in issues if timer.check_issue(channel_id, i, now)]
+        # One bulk JQL search resolves every remaining issue in a single REST
+        # round trip, which beats fanning out per-issue requests.  Short
+        # attachments skip the description/timetracking payload entirely.
+        summaries = self._slack_jira.get_summaries(filtered, full=full)
+        # Log all of these summaries in our timer so we ignore them.  Note that
+        # `summaries` must be a concrete list by this point: when it was a lazy
+        # generator the caller exhausted it before this line ran, so the timer
+        # cache never got populated and the threshold gate did nothing.
+        timer.log_issues(channel_id, [s.issue for s in summaries], now)
 
         return summaries
 
@@ -249,9 +361,41 @@ class JiraMessageHandler(object):
         :param message: The message, as returned by slackbot
         :type message: slackbot.dispatcher.Message
         """
-        issues = {i.upper() for i in self.JIRA_ISSUE_RE.findall(message.body.get("text", ""))}
+        text = message.body.get("text", "")
+        # Every ticket key contains a hyphen, and str membership is a memchr
+        # scan -- far cheaper than entering the regex engine on the ~99% of
+        # messages that cannot possibly mention a ticket
+        if not text or "-" not in text:
+            return
+
+        # Uppercase once so the case-sensitive pattern (and everything
+        # downstream) never case-folds again
+        text = text.upper()
+        # Cheap existence probe first: most remaining messages still contain no
+        # ticket-shaped tokens, so don't bother building the issues set for them
+        if not JIRA_ISSUE_RE.search(text):
+            return
+
+        issues = {m.group(0) for m in JIRA_ISSUE_RE.finditer(text)}
+        # Count guard first: project validation below can cost a REST round
+        # trip per unseen prefix, so bail on spammy token floods while this is
+        # still just a regex result
         if len(issues) > self._max_issues:
-            return logger.debug("Ignoring issue mentions %s, exceeded max issues threshold", issues)
+            # Guard the debug call so we don't pay for the repr of `issues` when
+            # debug logging is disabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Ignoring issue mentions %s, exceeded max issues threshold", issues)
+            return
+
+        # Drop tokens whose project is unknown before they reach the timer cache
+        # or the fetch pool; unseen prefixes are verified against JIRA once and
+        # the verdicts cached
+        valid_tickets = set(self._slack_jira.iter_valid_tickets(text))
+        issues = {i for i in issues if (i[1:] if i[0] == "!" else i) in valid_tickets}
+        # The search probe above should guarantee at least one hit, but keep the
+        # no-issue path free of the channel lookup and partial construction below
+        if not issues:
+            return
 
         channel_id = message.body.get("channel")
         if not channel_id:
@@ -262,20 +406,23 @@ class JiraMessageHandler(object):
         if not self._full_attachments:
             # TODO: Separation of long vs short attachments could be better, this will do for now
             issues = {i.replace("!", "") for i in issues}
-            attachments = map(self.get_short_attachment, get_summaries(issues)) or []
+            attachments = [self.get_short_attachment(s) for s in get_summaries(issues, False)]
         else:
-            # Extract long + short issues
-            long_issues = {i for i in issues if i.startswith("!")}
-            short_issues = issues - long_issues
-            # Generator here to effectively remove the ! since our get_summaries method
-            # is agnostic to "short vs long" issues
-            long_issues = (i[1:] for i in long_issues)
-
-            # Extract JIRA summaries from the issues and convert them into attachments
-            long_attachments = map(self.get_full_attachment, get_summaries(long_issues)) or []
-            short_attachments = map(self.get_short_attachment, get_summaries(short_issues)) or []
-            attachments = short_attachments + long_attachments
+            # Partition into long + short issues in one pass, stripping the ! marker
+            # as we go since our get_summaries method is agnostic to "short vs long"
+            long_issues, short_issues = [], []
+            for i in issues:
+                if i[0] == "!":
+                    long_issues.append(i[1:])
+                else:
+                    short_issues.append(i)
+
+            # Extract JIRA summaries from the issues and convert them into attachments,
+            # extending in place rather than concatenating two intermediate lists
+            attachments = [self.get_short_attachment(s) for s in get_summaries(short_issues, False)]
+            attachments.extend(
+                self.get_full_attachment(s) for s in get_summaries(long_issues, True))
 
         if attachments:
-            logger.info("Sent {} attachments".format(len(attachments)))
+            logger.info("Sent %d attachments", len(attachments))
             message.send_webapi("", attachments=attachments)
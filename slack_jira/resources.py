@@ -1,8 +1,12 @@
-import ConfigParser
+import concurrent.futures
+import configparser
 import functools
 import logging
 import collections
 import re
+import shelve
+import time
+import typing
 
 import jira
 
@@ -28,14 +32,55 @@ class JiraError(Error):
     """
 
 
-def get_config_value(config_parser, section, option, required=True, get_type=str, default=None):
+# Truthy/falsy config strings, mirroring ConfigParser.getboolean
+_BOOLEAN_STATES = {
+    "1": True, "yes": True, "true": True, "on": True,
+    "0": False, "no": False, "false": False, "off": False,
+}
+
+
+def _coerce_bool(value):
+    try:
+        return _BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError("Not a boolean: {}".format(value))
+
+
+# get_type -> coercion callable, resolved with one dict lookup instead of
+# re-running an if/elif chain on every config read
+_COERCE = {int: int, bool: _coerce_bool, str: str}
+
+
+def section_to_dict(conf, section):
     """
-    Retrieves a config value from a config parser.
+    Snapshots a config section into a plain dict.
 
-    :type config_parser: ConfigParser.ConfigParser
-    :param config_parser: The config parser object instance to extract values from
+    ConfigParser pays interpolation and exception machinery on every single get;
+    snapshotting once up front lets the `from_config` constructors read plain
+    dict entries instead.
+
+    :type conf: configparser.RawConfigParser
+    :param conf: The config parser object instance to extract the section from
     :type section: str
-    :param section: The section to extract values from
+    :param section: The section to snapshot
+
+    :rtype: dict
+    :return: A dict of option -> raw string value, empty if the section is missing
+    """
+    try:
+        return dict(conf.items(section))
+    except configparser.Error:
+        return {}
+
+
+def get_config_value(section_dict, section, option, required=True, get_type=str, default=None):
+    """
+    Retrieves a config value from a snapshotted config section.
+
+    :type section_dict: dict
+    :param section_dict: A section snapshot as returned by `section_to_dict`
+    :type section: str
+    :param section: The name of the snapshotted section, used for error messages
     :type option: str
     :param option: The option to extract a value from
     :type required: bool
@@ -44,69 +89,94 @@ def get_config_value(config_parser, section, option, required=True, get_type=str
     :param get_type: Specify the config parser type, either int|bool|str
 
     :rtype: str
-    :return: The value extracted from the ConfigParser object
+    :return: The value extracted from the section snapshot
 
-    :raises ConfigError: When the ConfigParser did not contain the specified value
-        based on the section and option
+    :raises ConfigError: When the snapshot did not contain the specified option
     """
-    if get_type is int:
-        getter = config_parser.getint
-    elif get_type is bool:
-        getter = config_parser.getboolean
-    else:
-        getter = config_parser.get
-
-    try:
-        value = getter(section, option)
-    except ConfigParser.Error:
+    value = section_dict.get(option)
+    if value is None:
         if required:
             raise ConfigError("Missing configuration '{}' in section '{}'".format(option, section))
         return default
 
-    return value
-
-
-__ISSUE_SUMMARY_FIELDS = [
-    "issue",
-    "title",
-    "status",
-    "priority",
-    "description",
-    "link",
-    "assignee",
-    "original_estimate",
-    "remaining_estimate",
-]
+    return _COERCE[get_type](value)
 
 
-class JiraIssueSummary(collections.namedtuple("JiraIssueSummary", __ISSUE_SUMMARY_FIELDS)):
+class JiraIssueSummary(typing.NamedTuple):
     """
     Named tuple that contains a summary of a Jira issue.
-    """
-    __slots__ = ()
-
 
-__JIRA_MSG_HANDLER_CONFIG_FIELDS = [
-    "max_issues",
-    "response_threshold",
-    "ticket_cache_size",
-    "full_attachments",
-]
-
-
-class JiraMsgHandlerConfig(collections.namedtuple("JiraMsgHandlerConfig",
-                                                  __JIRA_MSG_HANDLER_CONFIG_FIELDS)):
-    __slots__ = ()
+    `status` and `priority` are the plain display names: extracting them once at
+    build time means renderers never chase `.name` descriptors on live API
+    resources, and the tuple stays picklable for the persistent cache.
+    """
+    issue: str
+    title: str
+    status: str
+    priority: str
+    description: str
+    link: str
+    assignee: str
+    original_estimate: str
+    remaining_estimate: str
+
+
+class JiraMsgHandlerConfig(typing.NamedTuple):
+    max_issues: int
+    response_threshold: int
+    ticket_cache_size: int
+    full_attachments: bool
 
     @staticmethod
     def from_config(conf, section="jira_message_handler"):
-        get_value = functools.partial(get_config_value, conf, section, required=False)
-        return JiraMsgHandlerConfig(
-            max_issues=get_value("max_issues", get_type=int),
-            response_threshold=get_value("response_threshold", get_type=int),
-            ticket_cache_size=get_value("ticket_cache_size", get_type=int),
-            full_attachments=get_value("full_attachments", get_type=bool, default=True),
-        )
+        # Key the memo on the section contents, not the parser identity, so a
+        # mutated (or re-read) parser naturally misses the cache
+        items = tuple(sorted(section_to_dict(conf, section).items()))
+        return _msg_handler_config_from_items(section, items)
+
+
+@functools.lru_cache(maxsize=8)
+def _msg_handler_config_from_items(section, items):
+    section_dict = dict(items)
+    get_value = functools.partial(get_config_value, section_dict, section, required=False)
+    return JiraMsgHandlerConfig(
+        max_issues=get_value("max_issues", get_type=int),
+        response_threshold=get_value("response_threshold", get_type=int),
+        ticket_cache_size=get_value("ticket_cache_size", get_type=int),
+        full_attachments=get_value("full_attachments", get_type=bool, default=True),
+    )
+
+
+# Ticket validation pattern.  Case sensitive: callers uppercase their input once,
+# which beats per-character case folding inside the regex engine; fullmatch
+# rejects trailing junk such as "ABC-1junk".
+JIRA_TICKET_RE_STR = "[A-Z]{1,10}-[0-9]+"
+JIRA_TICKET_RE = re.compile(JIRA_TICKET_RE_STR, re.ASCII)
+# Bound method reference so the hot validation path skips the attribute lookups
+_TICKET_MATCH = JIRA_TICKET_RE.fullmatch
+
+# The issue fields JiraIssueSummary needs, in the comma-separated form the REST
+# API takes directly (avoids per-call list serialization inside `jira`).  The
+# short set leaves out `description` -- potentially an enormous blob -- and the
+# time tracking data, neither of which the short attachment renders.
+_FULL_ISSUE_FIELDS = "summary,description,priority,status,timetracking,assignee"
+_SHORT_ISSUE_FIELDS = "summary,priority,status,assignee"
+
+# Cache-key suffix distinguishing short summaries from full ones, so a short
+# fetch can never satisfy a request that renders the description
+_SHORT_KEY_SUFFIX = "#short"
+
+
+class _LightweightJIRA(jira.JIRA):
+    """
+    jira.JIRA builds a custom-field clause map at construction by GETting
+    /rest/api/2/field, which on servers with hundreds of custom fields can
+    dominate startup.  This bot only ever requests system fields by id and
+    never resolves custom field names, so skip that round trip entirely.
+    """
+
+    def fields(self):
+        return []
 
 
 class SlackJira(object):
@@ -114,23 +184,72 @@ class SlackJira(object):
     Object stores an authenticated JIRA instance and provides methods
     that are useful in retrieving summary information of JIRA issues.
     """
+    __slots__ = ("_jira", "_project_status", "_projects_cache",
+                 "_summary_cache", "_summary_cache_size", "_disk_cache",
+                 "_pool", "_browse_url")
+
     # Default section to parse information from
     JIRA_SECTION = "jira"
 
-    JIRA_TICKET_RE_STR = "[A-Z]{1,10}-[0-9]+"
-    JIRA_TICKET_RE = re.compile(JIRA_TICKET_RE_STR, re.IGNORECASE)
+    # Required OAuth options in the jira config section
+    OAUTH_FIELDS = ("access_token", "access_token_secret", "consumer_key")
+
+    # Upper bound on cached per-project existence verdicts
+    PROJECT_STATUS_CACHE_SIZE = 1024
+
+    # Default bound for the memoized issue summaries
+    DEFAULT_SUMMARY_CACHE_SIZE = 64
+
+    # How long (in seconds) a summary in the persistent cache stays servable
+    # before the issue is fetched again
+    SUMMARY_DISK_TTL = 86400
+
+    # Upper bound of keys resolved per JQL search, matching JIRA's default
+    # search page size; larger batches are fanned out over the thread pool
+    SEARCH_PAGE_SIZE = 50
 
-    def __init__(self, authed_jira):
+    def __init__(self, authed_jira, server=None, summary_cache_size=None,
+                 summary_cache_path=None):
         """
         :type authed_jira: jira.JIRA
         :param authed_jira: An authenticated jira.JIRA object that will be used
             to obtain information about various JIRA issues.
+        :type server: str
+        :param server: The JIRA server URL.  When given, issue links are built by
+            concatenating "<server>/browse/" with the key rather than calling
+            `permalink()` on every result; omit it to keep the permalink behavior.
+        :type summary_cache_size: int
+        :param summary_cache_size: Keep up to this many issue summaries memoized so
+            repeat mentions of the same ticket do not re-pay the REST round trip.
+            Defaults to DEFAULT_SUMMARY_CACHE_SIZE.
+        :type summary_cache_path: str
+        :param summary_cache_path: Optional path to a shelve file that persists
+            summaries across restarts.  Entries older than SUMMARY_DISK_TTL are
+            refetched, so a freshly restarted bot serves recent tickets without
+            re-paying their REST round trips.
         """
+        if not summary_cache_size:
+            summary_cache_size = self.DEFAULT_SUMMARY_CACHE_SIZE
 
         # Store the authenticated jira instance for future queries
         self._jira = authed_jira
-        # Store all known projects so we only query issues in known projects
-        self._projects_lookup = self.get_project_lookup()
+        # Per-project existence verdicts, verified lazily on first encounter.
+        # Servers can host thousands of projects while the bot only ever sees a
+        # handful, so this replaces the old fetch-everything-up-front lookup.
+        self._project_status = {}
+        # Last full project listing, fetched only when get_projects is called
+        self._projects_cache = None
+        # FIFO-bounded memo of issue -> JiraIssueSummary.  An explicit
+        # OrderedDict rather than functools.lru_cache, which would keep `self`
+        # alive through the bound method and is awkward to bound per instance.
+        self._summary_cache = collections.OrderedDict()
+        self._summary_cache_size = summary_cache_size
+        self._disk_cache = shelve.open(summary_cache_path) if summary_cache_path else None
+        # Searches are network bound and the jira Session is thread safe for
+        # GETs, so over-page-size batches overlap their round trips here
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="slackjira")
+        self._browse_url = server.rstrip("/") + "/browse/" if server else None
 
     @property
     def jira(self):
@@ -151,10 +270,56 @@ class SlackJira(object):
         :rtype: bool
         :return: Boolean signifying if the project was found
         """
-        return self._projects_lookup.get(project, False)
+        known = self._project_status.get(project)
+        if known is not None:
+            return known
+
+        try:
+            self._jira.project(project)
+            known = True
+        except jira.JIRAError:
+            known = False
+
+        self._project_status[project] = known
+        # Keep the cache bounded so a stream of made-up prefixes cannot grow it
+        # without limit; one eviction restores the cap
+        if len(self._project_status) > self.PROJECT_STATUS_CACHE_SIZE:
+            del self._project_status[next(iter(self._project_status))]
+
+        return known
+
+    def iter_valid_tickets(self, text):
+        """
+        Iterates over the deduplicated ticket keys in a blob of text that belong
+        to a known project.
+
+        One finditer pass plus a set membership per candidate is much cheaper than
+        letting every ticket-shaped token reach `get_summary` only to be rejected
+        by its own regex and project checks.
+
+        :type text: str
+        :param text: Free form text (e.g. a chat message) to scan for ticket keys
+
+        :return: Generator of uppercased ticket keys whose project exists in JIRA
+        """
+        # One upper() pass over the text replaces a per-match upper() and lets
+        # the pattern skip case folding; no-op copy when already uppercased
+        if not text.isupper():
+            text = text.upper()
+
+        seen = set()
+        for match in JIRA_TICKET_RE.finditer(text):
+            ticket = match.group(0)
+            if ticket in seen:
+                continue
+            seen.add(ticket)
+            if self.is_project(ticket.partition("-")[0]):
+                yield ticket
 
     def get_project_lookup(self):
-        return {getattr(k, "key"): True for k in self._jira.projects()}
+        # Immutable and value-free: membership is all callers need, and a
+        # frozenset carries no per-entry value slot
+        return frozenset(k.key for k in self._jira.projects())
 
     def get_projects(self, refresh=False):
         """
@@ -162,91 +327,212 @@ class SlackJira(object):
 
         :type refresh: bool
         :param refresh: If True, returns a non cached copy of the projects and will
-            store the new project lookup dict.
+            store the new project lookup set.
 
         :rtype: list
         :return: Returns a list of all the known projects in the JIRA server
         """
         if refresh:
-            self._projects_lookup = self.get_project_lookup()
+            # Memoized summaries may reference projects that no longer exist, so
+            # drop them along with the cached per-project verdicts
+            self._project_status.clear()
+            self.clear_summary_cache()
+            self._projects_cache = None
+
+        if self._projects_cache is None:
+            self._projects_cache = self.get_project_lookup()
+            # Seed the verdict cache so subsequent is_project calls on these
+            # keys do not each pay a verification round trip
+            for key in self._projects_cache:
+                self._project_status[key] = True
+
+        return list(self._projects_cache)
+
+    def _build_summary(self, issue, result, full):
+        """
+        Builds and memoizes a JiraIssueSummary from a jira.Issue resource.
+        """
+        fields = result.fields
 
-        return self._projects_lookup.keys()
+        assignee = None
+        if fields.assignee:
+            assignee = getattr(fields.assignee, "displayName", None)
+
+        # getattr with a default is a single atomic lookup; the old
+        # hasattr-then-getattr helper paid for each attribute twice
+        # A precomputed prefix plus the key is the same URL permalink() builds,
+        # minus its per-call option lookups and urljoin
+        if self._browse_url is not None:
+            link = self._browse_url + issue
+        else:
+            link = result.permalink()
+
+        # Short fetches omit these fields entirely, so default them to None to
+        # keep the namedtuple shape stable
+        timetracking = getattr(fields, "timetracking", None)
+        # Positional construction in declared field order; namedtuple's __new__
+        # pays a Python-level kwargs-to-positional shuffle otherwise
+        summary = JiraIssueSummary(
+            issue,
+            fields.summary,
+            getattr(fields.status, "name", None),
+            getattr(fields.priority, "name", None),
+            getattr(fields, "description", None),
+            link,
+            assignee,
+            getattr(timetracking, "originalEstimate", None),
+            getattr(timetracking, "remainingEstimate", None),
+        )
 
-    def __get_attr_helper(self, object, field, default=None):
-        """
-        Helper method is needed to call hasattr first and then calling getattr
-        with a default value.
+        cache_key = issue if full else issue + _SHORT_KEY_SUFFIX
+        self._memoize(cache_key, summary)
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache[cache_key] = (time.time(), summary)
+            except (TypeError, ValueError):
+                # Losing a disk entry is fine, failing the fetch is not
+                logger.debug("Could not persist summary for %s", issue)
 
-        The __getattr__ method is supposed to handle a default case, but it
-        seems like it is not written properly (yet) :-(
-        """
-        # TODO: Make PR to fix this ^ bug
-        if hasattr(object, field):
-            return getattr(object, field)
+        return summary
 
-        return default
+    def _memoize(self, cache_key, summary):
+        self._summary_cache[cache_key] = summary
+        if len(self._summary_cache) > self._summary_cache_size:
+            self._summary_cache.popitem(last=False)
 
-    def get_summary(self, issue):
+    def get_summary(self, issue, full=True):
         """
         Get the general summary of a JIRA issue.
 
         :type issue: str
         :param issue: The issue key in JIRA.  This is typically a value that contains
             a string, then a hyphen, then numbers such as "ISSUE-1337".
+        :type full: bool
+        :param full: See `get_summaries`
 
         :rtype: JiraIssueSummary|None
         :return: A JiraIssueSummary namedtuple (if the issue was valid and found) otherwise
             None is returned
         """
-        # Ensure that we do have a valid issue
-        if not self.JIRA_TICKET_RE.match(issue):
-            return logger.warning("Attempted to retrieve invalid ticket: %s", issue)
+        summaries = self.get_summaries((issue,), full=full)
+        return summaries[0] if summaries else None
 
-        project, number = issue.split("-")
-        project = project.upper()
+    def get_summaries(self, issues, full=True):
+        """
+        Get the general summaries of several JIRA issues at once.
+
+        All issues that are valid and not already memoized are resolved with a
+        single JQL search, so a message mentioning K distinct tickets costs one
+        REST round trip rather than K.
 
-        # Ensure that we only attempt to retrieve valid issues
-        if not self.is_project(project):
-            return logger.warning("Attempted to retrieve invalid ticket: %s", issue)
+        :type issues: collections.Iterable
+        :param issues: Iterable of issue keys such as "ISSUE-1337"
+        :type full: bool
+        :param full: When False, the description and time tracking fields are
+            neither requested nor populated (left as None), which keeps the
+            response payload small for renderers that never show them.  Short
+            and full summaries are memoized separately.
 
+        :rtype: list
+        :return: A list of JiraIssueSummary namedtuples for the issues that were
+            valid and found; invalid or unknown issues are silently dropped
+            (with a warning logged)
+        """
+        # One level check up front instead of letting every bad token in a
+        # flood of invalid mentions pay handler dispatch individually
+        warn_enabled = logger.isEnabledFor(logging.WARNING)
+
+        summaries = []
+        to_fetch = []
+        for issue in issues:
+            # Normalize before validating; JIRA keys are uppercase, the pattern
+            # is case sensitive, and this keeps one cache entry per ticket
+            # regardless of how it was typed
+            if not issue.isupper():
+                issue = issue.upper()
+
+            # Ensure that we do have a valid issue
+            if not _TICKET_MATCH(issue):
+                if warn_enabled:
+                    logger.warning("Attempted to retrieve invalid ticket: %s", issue)
+                continue
+
+            # Ensure that we only attempt to retrieve valid issues.  partition
+            # stops at the first separator and returns a fixed tuple, unlike
+            # split which allocates a list; the number part is never used.
+            if not self.is_project(issue.partition("-")[0]):
+                if warn_enabled:
+                    logger.warning("Attempted to retrieve invalid ticket: %s", issue)
+                continue
+
+            # Serve repeat mentions from the memo instead of re-fetching
+            cache_key = issue if full else issue + _SHORT_KEY_SUFFIX
+            summary = self._summary_cache.get(cache_key)
+            if summary is None and self._disk_cache is not None:
+                # Fall back to the persistent cache (survives restarts) and
+                # promote fresh hits into the in-memory memo
+                entry = self._disk_cache.get(cache_key)
+                if entry is not None and time.time() - entry[0] <= self.SUMMARY_DISK_TTL:
+                    summary = entry[1]
+                    self._memoize(cache_key, summary)
+
+            if summary is not None:
+                summaries.append(summary)
+            else:
+                to_fetch.append(issue)
+
+        if not to_fetch:
+            return summaries
+
+        if len(to_fetch) <= self.SEARCH_PAGE_SIZE:
+            summaries.extend(self._search_summaries(to_fetch, full))
+        else:
+            # More keys than fit in one page: chunk to the page size and let the
+            # pool overlap the searches instead of paging them sequentially
+            batches = [
+                to_fetch[i:i + self.SEARCH_PAGE_SIZE]
+                for i in range(0, len(to_fetch), self.SEARCH_PAGE_SIZE)
+            ]
+            search = functools.partial(self._search_summaries, full=full)
+            for batch_summaries in self._pool.map(search, batches):
+                summaries.extend(batch_summaries)
+
+        return summaries
+
+    def _search_summaries(self, to_fetch, full):
+        """
+        Resolves a batch of (validated) issue keys with a single JQL search.
+        """
+        # Request only the fields we render and suppress the default expansions
+        # (renderedFields etc.) to keep the response small.  validate_query is
+        # off so a stale or typo'd key simply matches nothing -- with
+        # validation on, JIRA 400s the whole query and one bad key would
+        # suppress every valid ticket in the batch
+        jql = "key in ({})".format(",".join(to_fetch))
         try:
-            result = self._jira.issue(
-                issue,
-                fields=[
-                    "summary",
-                    "description",
-                    "priority",
-                    "status",
-                    "timetracking",
-                    "assignee",
-                ],
+            results = self._jira.search_issues(
+                jql,
+                fields=_FULL_ISSUE_FIELDS if full else _SHORT_ISSUE_FIELDS,
+                maxResults=len(to_fetch),
+                expand="",
+                validate_query=False,
             )
         except jira.JIRAError as e:
-            logger.error("Error loading issue {}: {}".format(issue, e))
-            return None
+            logger.error("Error loading issues %s: %s", to_fetch, e)
+            return []
 
-        assignee = None
-        if result.fields.assignee:
-            assignee = self.__get_attr_helper(result.fields.assignee, "displayName")
-
-        return JiraIssueSummary(
-            issue=issue,
-            title=result.fields.summary,
-            status=result.fields.status,
-            priority=result.fields.priority,
-            description=result.fields.description,
-            link=result.permalink(),
-            assignee=assignee,
-            original_estimate=self.__get_attr_helper(
-                result.fields.timetracking, "originalEstimate"
-            ),
-            remaining_estimate=self.__get_attr_helper(
-                result.fields.timetracking, "remainingEstimate"
-            )
-        )
+        return [self._build_summary(result.key, result, full) for result in results]
+
+    def clear_summary_cache(self):
+        """
+        Drops all memoized issue summaries so subsequent lookups hit JIRA again.
+        """
+        self._summary_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
 
     @staticmethod
-    def from_config(conf, jira_section=JIRA_SECTION):
+    def from_config(conf, jira_section=JIRA_SECTION, summary_cache_size=None):
         """
         Instantiates a JiraSlack object from a ConfigParser object.
 
@@ -260,10 +546,13 @@ class SlackJira(object):
 
         Additional documentation can be found in `settings.template.ini`
 
-        :type conf: ConfigParser.ConfigParser
+        :type conf: configparser.RawConfigParser
         :param conf: The config object to parse settings from
         :type jira_section: str
         :param jira_section: The section in the config where the jira settings are located
+        :type summary_cache_size: int
+        :param summary_cache_size: Optional bound for the memoized issue summaries,
+            passed through to the SlackJira constructor
 
         :rtype: SlackJira
         :return: An instantiated SlackJira from the config parser.
@@ -272,26 +561,46 @@ class SlackJira(object):
         :raises ConfigError: If there was an error parsing the config file
             (perhaps a configuration was missing)
         """
-        oauth_dict = {
-            k: get_config_value(conf, jira_section, k)
-            for k in ("access_token", "access_token_secret", "consumer_key")
-        }
-        # Load the private key certificate
-        key_cert_file_path = get_config_value(conf, jira_section, "key_cert_path")
+        jira_conf = section_to_dict(conf, jira_section)
+        # Validate all the OAuth options with one set difference rather than a
+        # per-option lookup-and-raise round through get_config_value
+        missing = set(SlackJira.OAUTH_FIELDS) - jira_conf.keys()
+        if missing:
+            raise ConfigError("Missing configuration(s) {} in section '{}'".format(
+                ", ".join(sorted(missing)), jira_section))
+        oauth_dict = {k: jira_conf[k] for k in SlackJira.OAUTH_FIELDS}
+        # Load the private key certificate.  PEM is plain ASCII and the jira
+        # library accepts bytes, so read it binary -- this skips the text-mode
+        # decode and sidesteps platform newline translation mangling the key.
+        key_cert_file_path = get_config_value(jira_conf, jira_section, "key_cert_path")
         try:
-            with open(key_cert_file_path) as fp:
+            with open(key_cert_file_path, "rb") as fp:
                 oauth_dict["key_cert"] = fp.read()
-        except IOError as e:
+        except FileNotFoundError:
+            raise ConfigError(
+                "key_cert_path '{}' does not exist; check the '{}' section of the "
+                "config".format(key_cert_file_path, jira_section))
+        except OSError as e:
             raise ConfigError(str(e))
 
-        server_location = get_config_value(conf, jira_section, "server")
+        server_location = get_config_value(jira_conf, jira_section, "server")
+        summary_cache_path = get_config_value(
+            jira_conf, jira_section, "summary_cache_path", required=False)
         try:
-            return SlackJira(jira.JIRA(server=server_location, oauth=oauth_dict))
+            return SlackJira(
+                _LightweightJIRA(server=server_location, oauth=oauth_dict),
+                server=server_location,
+                summary_cache_size=summary_cache_size,
+                summary_cache_path=summary_cache_path,
+            )
         except jira.JIRAError as e:
             raise JiraError(e)
 
 
 class SlackBotConfig(object):
+    __slots__ = ("_api_token", "_bot_emoji", "_bot_icon", "_errors_to",
+                 "_slackbot_plugins")
+
     def __init__(self, api_token, slackbot_plugins, bot_emoji=None, bot_icon=None, errors_to=None):
         self._api_token = api_token
         self._bot_emoji = bot_emoji
@@ -325,7 +634,7 @@ class SlackBotConfig(object):
             settings_module.ERRORS_TO = self._errors_to
 
         # TODO: Perhaps figure out a better way to do this...
-        settings_module.PLUGINS = set(self._slackbot_plugins)
+        settings_module.PLUGINS = self._slackbot_plugins
 
     @staticmethod
     def from_config(conf, section="slackbot"):
@@ -333,7 +642,7 @@ class SlackBotConfig(object):
         Loads the slack options from a ConfigParser object.
 
         :param conf: ConfigParser object with slackbot settings
-        :type conf: ConfigParser.ConfigParser
+        :type conf: configparser.RawConfigParser
         :param section: The section to extract settings from.  Defaults to "slackbot"
         :type section: str
 
@@ -343,15 +652,24 @@ class SlackBotConfig(object):
         :raises: ConfigError: When the config did not contain the specified section
             or required options.
         """
-        get_conf = functools.partial(get_config_value, conf, section)
-
-        conf_slackbot_plugins = get_conf("slackbot_plugins")
-        plugins = [p.strip() for p in conf_slackbot_plugins.split(",")]
-
-        return SlackBotConfig(
-            api_token=get_conf("api_token"),
-            slackbot_plugins=plugins,
-            bot_emoji=get_conf("bot_emoji", required=False),
-            bot_icon=get_conf("bot_icon", required=False),
-            errors_to=get_conf("errors_to", required=False),
-        )
+        items = tuple(sorted(section_to_dict(conf, section).items()))
+        return _slackbot_config_from_items(section, items)
+
+
+@functools.lru_cache(maxsize=8)
+def _slackbot_config_from_items(section, items):
+    section_dict = dict(items)
+    get_conf = functools.partial(get_config_value, section_dict, section)
+
+    conf_slackbot_plugins = get_conf("slackbot_plugins")
+    # Freeze once at parse time (also drops empty entries from trailing commas)
+    # so load_into_settings_module can hand out the same immutable object
+    plugins = frozenset(p.strip() for p in conf_slackbot_plugins.split(",") if p.strip())
+
+    return SlackBotConfig(
+        api_token=get_conf("api_token"),
+        slackbot_plugins=plugins,
+        bot_emoji=get_conf("bot_emoji", required=False),
+        bot_icon=get_conf("bot_icon", required=False),
+        errors_to=get_conf("errors_to", required=False),
+    )
@@ -4,6 +4,7 @@ This module is used to configure the slackbot for jira responses.
 This is where we define what the bot should listen to and how to respond
 specifically for JIRA tickets.
 """
+import functools
 import re
 
 import slackbot.settings
@@ -17,8 +18,11 @@ def get_jira_msg_handler(conf=None):
     if not conf:
         conf = slackbot.settings.SLACK_JIRA_CONF
 
-    authorized_slack_jira = slack_jira.resources.SlackJira.from_config(conf)
     jira_msg_handler_config = slack_jira.resources.JiraMsgHandlerConfig.from_config(conf)
+    authorized_slack_jira = slack_jira.resources.SlackJira.from_config(
+        conf,
+        summary_cache_size=jira_msg_handler_config.ticket_cache_size,
+    )
     return slack_jira.handlers.JiraMessageHandler(
         slack_jira=authorized_slack_jira,
         max_issues=jira_msg_handler_config.max_issues,
@@ -27,17 +31,24 @@ def get_jira_msg_handler(conf=None):
     )
 
 
-# TODO: register these plugins into a singleton instead of using this module based importation
-jira_msg_handler = get_jira_msg_handler()
+# Building the handler performs the full OAuth handshake against JIRA, so defer
+# it to the first matching message instead of paying it at plugin import --
+# slackbot imports every plugin module at startup whether or not JIRA is ever
+# mentioned.  lru_cache doubles as the singleton the old module-level TODO
+# asked for.
+@functools.lru_cache(maxsize=1)
+def _get_handler():
+    return get_jira_msg_handler()
 
 
-# Listen & respond to messages in channel
-@bot.listen_to(jira_msg_handler.JIRA_ISSUE_RE_STR, re.IGNORECASE)
+# Listen & respond to messages in channel.  The pattern is a module constant,
+# so registering the callbacks needs no handler instance.
+@bot.listen_to(slack_jira.handlers.JIRA_ISSUE_RE_STR, re.IGNORECASE)
 def jira_short_match(message):
-    jira_msg_handler.handle_mention(message)
+    _get_handler().handle_mention(message)
 
 
 # Respond to direct messages!
-@bot.respond_to(jira_msg_handler.JIRA_ISSUE_RE_STR, re.IGNORECASE)
-def jira_short_match(message):
-    jira_msg_handler.handle_mention(message)
+@bot.respond_to(slack_jira.handlers.JIRA_ISSUE_RE_STR, re.IGNORECASE)
+def jira_direct_match(message):
+    _get_handler().handle_mention(message)